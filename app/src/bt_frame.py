@@ -0,0 +1,67 @@
+# Copyright (c) 2022 Robert Bosch GmbH and Microsoft Corporation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Newline framing of the BT module serial stream."""
+
+import logging
+import os
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+# Size of the BT receive buffer, a single command frame must fit into it.
+BT_FRAME_MAX = 256
+
+
+class BTFrameBuffer:
+    """Fixed size receive buffer that splits newline-terminated BT frames."""
+
+    def __init__(self, size: int = BT_FRAME_MAX):
+        self._accum = bytearray(size)
+        self._view = memoryview(self._accum)
+        self._len = 0
+        self._overflow = False
+
+    def read(self, fd: int) -> List[bytes]:
+        """Read the available bytes from fd and return the completed frames.
+
+        A trailing partial frame is kept for the next read, a frame longer than
+        the buffer is dropped up to its newline. Raises EOFError at end of file;
+        errors of os.readv (including BlockingIOError) are passed on.
+        """
+        # Read straight into the free tail of the buffer, no per-read bytes.
+        n = os.readv(fd, [self._view[self._len :]])
+        if n == 0:
+            raise EOFError("end of file")
+        end = self._len + n
+        start = 0
+        frames = []
+        newline = self._accum.find(b"\n", start, end)
+        while newline >= 0:
+            if self._overflow:
+                # Tail of a frame that did not fit into the buffer.
+                self._overflow = False
+            else:
+                frames.append(bytes(self._view[start:newline]))
+            start = newline + 1
+            newline = self._accum.find(b"\n", start, end)
+        # Move a trailing partial frame to the front of the buffer.
+        self._len = end - start
+        if start and self._len:
+            self._view[: self._len] = self._view[start:end]
+        if self._len == len(self._accum):
+            logger.error("BT frame exceeds %d bytes, dropped.", len(self._accum))
+            self._len = 0
+            self._overflow = True
+        return frames
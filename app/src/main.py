@@ -15,10 +15,15 @@
 """A sample skeleton vehicle app."""
 
 import asyncio
-import json
+import fcntl
 import logging
+import math
+import os
 import signal
-import queue
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+import orjson
 
 from sdv.util.log import (  # type: ignore
     get_opentelemetry_log_factory,
@@ -29,19 +34,49 @@
 from sdv_model import Vehicle, vehicle  # type: ignore
 
 import serial
+import uvloop
+
+from bt_frame import BTFrameBuffer
 
-# Configure the VehicleApp logger with the necessary log config and level.
-logging.setLogRecordFactory(get_opentelemetry_log_factory())
-logging.basicConfig(format=get_opentelemetry_log_format())
-logging.getLogger().setLevel("DEBUG")
 logger = logging.getLogger(__name__)
 
+
+def _configure_logging():
+    """Configure the VehicleApp logger with the necessary log config and level."""
+    logging.setLogRecordFactory(get_opentelemetry_log_factory())
+    logging.basicConfig(format=get_opentelemetry_log_format())
+    # Log level can be overridden via the LOG_LEVEL environment variable.
+    log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
+    if not isinstance(logging.getLevelName(log_level), int):
+        logging.warning("Invalid LOG_LEVEL %r, falling back to INFO.", log_level)
+        log_level = "INFO"
+    logging.getLogger().setLevel(log_level)
+
+# orjson is used on the MQTT message paths; publish_mqtt_event expects str.
+_loads = orjson.loads
+
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj).decode()
+
+
+# Fixed-shape response envelopes, only the variable field is filled in per call.
+_SPEED_RESULT_TPL = '{{"result":{{"status":0,"message":"Current Speed = {}"}}}}'.format
+_VOICE_RESULT_TPL = '{{"result":{{"status":1,"message":{}}}}}'.format
+
+
 GET_SPEED_REQUEST_TOPIC = "sampleapp/getSpeed"
 GET_SPEED_RESPONSE_TOPIC = "sampleapp/getSpeed/response"
 DATABROKER_SUBSCRIPTION_TOPIC = "sampleapp/currentSpeed"
 VOICE_CONTROL_REQUEST_TOPIC = "tw_mcu/sdvos_voice_ctrl"
 VOICE_CONTROL_RESPONSE_TOPICE = "tw_mcu/sdvos_voice_ctrl/response"
 
+# Time (seconds) an actuator keeps moving on a voice command before it is stopped.
+ACTUATOR_STOP_DELAY = 2
+
+# Minimum interval (seconds) between two current speed publishes.
+SPEED_PUBLISH_INTERVAL = 0.1
+
 # Voice command definition
 SDVOS_SEAT_MOVE_FORWARD = 0
 SDVOS_SEAT_MOVE_BACKWARD = 1
@@ -52,6 +87,7 @@
 SDVOS_MIRRORREAR_TITL_UP = 6
 SDVOS_MIRRORREAR_TITL_DOWN = 7
 SDVOS_LUMBAR_SUPPORT_01_INFLATION = 8
+# Both air cells share command 8, they are inflated one after the other.
 SDVOS_LUMBAR_SUPPORT_02_INFLATION = 8
 SDVOS_LUMBAR_SUPPORT_DEFLATION = 9
 
@@ -82,20 +118,88 @@
 VSS_LUMBAR_AIRCELL_STOP = 126
 VSS_LUMBAR_AIRCELL_DEFLATION = 127
 
-
-# Current Seat Postion
-seat_position_current = VSS_SEAT_POSITION_BASE
+# BT seat command (seatCali, status) -> (VSS value, description)
+_SEAT_DISPATCH: Dict[Tuple[Optional[int], Optional[bool]], Tuple[int, str]] = {
+    (1, True): (VSS_SEAT_BACKWARD, "BACKWARD"),
+    (1, False): (VSS_SEAT_MOVE_STOP, "STOP BACK"),
+    (0, True): (VSS_SEAT_FORWARD, "FOWARD"),
+    (0, False): (VSS_SEAT_MOVE_STOP, "STOP FWD"),
+}
+
+# BT mirror command (mirrorCali, status) -> (axis, VSS value, description)
+_MIRROR_DISPATCH: Dict[
+    Tuple[Optional[int], Optional[bool]], Tuple[str, int, str]
+] = {
+    (0, True): ("pan", VSS_MIRROR_PAN_LEFT, "### MIRROR PAN LEFT"),
+    (0, False): ("pan", VSS_MIRROR_MOVE_STOP, "MIRROR STOP"),
+    (2, True): ("pan", VSS_MIRROR_PAN_RIGHT, "MIRROR PAN RIGHT"),
+    (2, False): ("pan", VSS_MIRROR_MOVE_STOP, "MIRROR STOP"),
+    (1, True): ("tilt", VSS_MIRROR_TILT_UP, "MIRROR TILT UP"),
+    (1, False): ("tilt", VSS_MIRROR_MOVE_STOP, "MIRROR STOP"),
+    (3, True): ("tilt", VSS_MIRROR_TILT_DOWN, "MIRROR TILT DOWN"),
+    (3, False): ("tilt", VSS_MIRROR_MOVE_STOP, "MIRROR STOP"),
+}
+
+# BT air cell command -> (VSS value, description)
+_AIRCELL_DISPATCH: Dict[Optional[int], Tuple[int, str]] = {
+    0: (VSS_LUMBAR_AIRCELL0, "AIR CELL0 inflation."),
+    1: (VSS_LUMBAR_AIRCELL1, "AIR CELL1 inflation."),
+    2: (VSS_LUMBAR_AIRCELL_STOP, "STOP ALL AIR CELL INFLATION"),
+    3: (VSS_LUMBAR_AIRCELL_DEFLATION, "DEFLATION ALL"),
+}
+
+
+def _bt_int(raw: dict, name: str) -> Optional[int]:
+    value = raw.get(name)
+    # bool is an int, true/false count as 1/0 like in the original comparisons.
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, float) and math.isfinite(value):
+        return int(value)
+    logger.error("Parse BT cmd field %s=%r failed.", name, value)
+    return None
+
+
+@dataclass
+class BTCmd:
+    """BT control command sent by the MobilePhone APP, absent fields are None."""
+
+    seatPos: Optional[int] = None
+    seatCali: Optional[int] = None
+    status: Optional[bool] = None
+    mirrorCali: Optional[int] = None
+    aircell: Optional[int] = None
+    fan: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> "BTCmd":
+        """Build the command from a decoded BT frame.
+
+        Numbers must be JSON numbers, floats are truncated; a field of another
+        type is logged and left as None, the other fields are still applied.
+        status is taken by truthiness.
+        """
+        status = raw.get("status")
+        return cls(
+            seatPos=_bt_int(raw, "seatPos"),
+            seatCali=_bt_int(raw, "seatCali"),
+            status=None if status is None else bool(status),
+            mirrorCali=_bt_int(raw, "mirrorCali"),
+            aircell=_bt_int(raw, "aircell"),
+            fan=_bt_int(raw, "fan"),
+        )
 
 
-gSer = None
-msgQ = queue.Queue()
+def _open_bt_serial() -> Optional[serial.Serial]:
+    """Open the BT module serial port, None if it is not available."""
+    try:
+        ser = serial.Serial("/dev/ttyUSB0", 9600, timeout=1)
+    except OSError:
+        logger.error("Failed to open bluethooth module.")
+        return None
+    logger.debug("BT module connected: %s", ser.isOpen())
+    return ser
 
-try:
-    gSer = serial.Serial("/dev/ttyUSB0", 9600, timeout=1)
-    logging.debug("BT module connected:" + str(gSer.isOpen()))
-except:
-    logging.error("Failed to open bluethooth module.")
-    pass
 
 class SampleApp(VehicleApp):
     """
@@ -117,151 +221,215 @@ def __init__(self, vehicle_client: Vehicle):
         super().__init__()
         self.Vehicle = vehicle_client
         self._idx = 0
+        self._ser: Optional[serial.Serial] = None
+        self._fd = -1
+        self._bt_frames = BTFrameBuffer()
+        # Received BT frames, handled in order by on_got_msg.
+        self._msg_q: "asyncio.Queue[bytes]" = asyncio.Queue()
+        # Outgoing MQTT events, published in order by mqtt_writer.
+        self._pub_q: "asyncio.Queue[Tuple[str, str]]" = asyncio.Queue()
+        self._stop_timers: Dict[Callable, asyncio.TimerHandle] = {}
+        self._stop_tasks: Set[asyncio.Task] = set()
+        # Last seat position successfully sent to the DataBroker; voice and BT
+        # commands both update it, so read-modify-write happens under the lock.
+        self._seat_pos = VSS_SEAT_POSITION_BASE
+        self._seat_lock = asyncio.Lock()
+        # Bound setters of the actuated signals, resolved once.
+        self._set_seat_pos = self.Vehicle.Cabin.Seat.Row1.Pos1.Position.set
+        self._set_mirror_pan = self.Vehicle.Body.Mirrors.Left.Pan.set
+        self._set_mirror_tilt = self.Vehicle.Body.Mirrors.Left.Tilt.set
+        self._set_lumbar = self.Vehicle.Cabin.Seat.Row1.Pos1.Backrest.Lumbar.Support.set
+        self._set_fan = self.Vehicle.Cabin.HVAC.Station.Row1.Left.FanSpeed.set
+        self._last_speed_pub = 0.0
+        self._pending_speed = None
+        # Set while _pending_speed holds a value that was not published yet.
+        self._speed_dirty = False
+        self._speed_timer: Optional[asyncio.TimerHandle] = None
 
     async def on_start(self):
-        global gSer
         """Run when the vehicle app starts"""
         # This method will be called by the SDK when the connection to the
         # Vehicle DataBroker is ready.
         # Here you can subscribe for the Vehicle Signals update (e.g. Vehicle Speed).
         await self.Vehicle.Speed.subscribe(self.on_speed_change)
-        LOOP.create_task(self.on_timer())
-        LOOP.create_task(self.on_got_msg())
-        # LOOP.create_task(self.bt_handler())
-        LOOP.add_reader(gSer, self.on_recv_bt_data)
+        loop = asyncio.get_running_loop()
+        loop.create_task(self.mqtt_writer())
+        loop.create_task(self.on_timer())
+        loop.create_task(self.on_got_msg())
+        # loop.create_task(self.bt_handler())
+        self._ser = _open_bt_serial()
+        if self._ser is not None:
+            # Read the serial port fd without blocking, frames are split in
+            # on_recv_bt_data so a stalled link never blocks the loop.
+            self._ser.timeout = 0
+            self._fd = self._ser.fileno()
+            flags = fcntl.fcntl(self._fd, fcntl.F_GETFL)
+            fcntl.fcntl(self._fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+            loop.add_reader(self._fd, self.on_recv_bt_data)
         pass
 
+    def _schedule_stop(self, set_fn, stop_val, delay=ACTUATOR_STOP_DELAY, then=None):
+        """Send stop_val via set_fn after delay seconds without blocking the caller.
+
+        A pending stop for the same actuator is re-armed, so repeated commands
+        keep it moving until delay seconds after the last one. If then is given,
+        it is sent after the stop and stopped again after another delay.
+        """
+        self._cancel_stop(set_fn)
+        self._stop_timers[set_fn] = asyncio.get_running_loop().call_later(
+            delay, self._fire_stop, set_fn, stop_val, then
+        )
+
+    def _cancel_stop(self, set_fn):
+        timer = self._stop_timers.pop(set_fn, None)
+        if timer is not None:
+            timer.cancel()
+
+    def _fire_stop(self, set_fn, stop_val, then):
+        self._stop_timers.pop(set_fn, None)
+        task = asyncio.get_running_loop().create_task(
+            self._send_stop(set_fn, stop_val, then)
+        )
+        # Keep a reference until the stop has been sent.
+        self._stop_tasks.add(task)
+        task.add_done_callback(self._stop_tasks.discard)
+
+    async def _send_stop(self, set_fn, stop_val, then):
+        try:
+            await set_fn(stop_val)
+            # A command received in the meantime takes over the actuator.
+            if then is not None and set_fn not in self._stop_timers:
+                await set_fn(then)
+                self._schedule_stop(set_fn, stop_val)
+        except Exception:
+            logger.exception("Send actuator stop %s failed.", stop_val)
+
+    async def move_seat_to(self, position: Optional[int], move: Optional[int] = None):
+        """Send the seat position, then the seat move command, in this order."""
+        # _seat_pos is only the last value this app sent, not the motor state,
+        # so an explicit position is always forwarded.
+        async with self._seat_lock:
+            if position is not None:
+                await self._set_seat_pos(position)
+                self._seat_pos = position
+            if move is not None:
+                await self._set_seat_pos(move)
+
+    def queue_mqtt_event(self, topic: str, payload: str):
+        self._pub_q.put_nowait((topic, payload))
+
+    async def mqtt_writer(self):
+        while True:
+            topic, payload = await self._pub_q.get()
+            try:
+                await self.publish_mqtt_event(topic, payload)
+            except Exception:
+                logger.exception("Publish MQTT event to %s failed.", topic)
+
     async def on_got_msg(self):
-        global msgQ
         logger.debug("msg queue handler task.")
-        while 1:
-            if msgQ.qsize() > 0:
-                msg = msgQ.get()
-
-                # Parse BT control command from MobilePhone APP.
-                try:
-                    app_dit = json.loads(msg)
-                except:
-                    logger.error("Parser BT cmd JSON failed.")
-                    continue
-                    pass
-                try:
-                    ###################################################################
-                    # Free control seat position.
-                    t_seat_pos = int(app_dit['seatPos'])
-                    if t_seat_pos > 0 and t_seat_pos <= 100:
-                        logger.debug("Send seat position")
-                        await self.Vehicle.Cabin.Seat.Row1.Pos1.Position.set(t_seat_pos)
-                except:
-                    logger.error("Parse seat free control position failed.")
-                    pass
-
-                # Parse BT Seat ECU control command from MobilePhone APP
-                try:
-                    if app_dit['seatCali'] == 1 and app_dit['status']:
-                        logger.debug("BACKWARD")
-                        await self.Vehicle.Cabin.Seat.Row1.Pos1.Position.set(VSS_SEAT_BACKWARD)
-                    elif app_dit['seatCali'] == 1 and not app_dit['status']:
-                        logger.debug("STOP BACK")
-                        await self.Vehicle.Cabin.Seat.Row1.Pos1.Position.set(VSS_SEAT_MOVE_STOP)
-                        self.Vehicle.Cabin.Seat.Row1.Pos1.Position.set(VSS_LUMBAR_AIRCELL1)
-                    elif app_dit['seatCali'] == 0 and app_dit['status']:
-                        logger.debug("FOWARD")
-                        await self.Vehicle.Cabin.Seat.Row1.Pos1.Position.set(VSS_SEAT_FORWARD)
-                        await self.Vehicle.Cabin.Seat.Row1.p
-                    elif app_dit['seatCali'] == 0 and not app_dit['stat-f']:
-                        logger.debug("STOP FWD")
-                        await self.Vehicle.Cabin.Seat.Row1.Pos1.Position.set(VSS_SEAT_MOVE_STOP)
-                    else:
-                        pass
-                except:
-                    logger.error("[ERROR] Parse seat open loop control position error.")
-                    pass
-
-                # Parse BT Mirror ECU control command from MobilePhone APP
-                try:
-                    if app_dit['mirrorCali'] == 0 and app_dit['status']:
-                        logger.debug("### MIRROR PAN LEFT")
-                        await self.Vehicle.Body.Mirrors.Left.Pan.set(VSS_MIRROR_PAN_LEFT)
-                    elif app_dit['mirrorCali'] == 0 and not app_dit['status']:
-                        logger.debug("MIRROR STOP")
-                        await self.Vehicle.Body.Mirrors.Left.Pan.set(VSS_MIRROR_MOVE_STOP)
-                    elif app_dit['mirrorCali'] == 2 and app_dit['status']:
-                        logger.debug("MIRROR PAN RIGHT")
-                        await self.Vehicle.Body.Mirrors.Left.Pan.set(VSS_MIRROR_PAN_RIGHT)
-                    elif app_dit['mirrorCali'] == 2 and not app_dit['status']:
-                        logger.debug("MIRROR STOP")
-                        await self.Vehicle.Body.Mirrors.Left.Pan.set(VSS_MIRROR_MOVE_STOP)
-                    elif app_dit['mirrorCali'] == 1 and app_dit['status']:
-                        logger.debug("MIRROR TILT UP")
-                        await self.Vehicle.Body.Mirrors.Left.Tilt.set(VSS_MIRROR_TILT_UP)
-                    elif app_dit['mirrorCali'] == 1 and not app_dit['status']:
-                        logger.debug("MIRROR STOP")
-                        await self.Vehicle.Body.Mirrors.Left.Tilt.set(VSS_MIRROR_MOVE_STOP)
-                    elif app_dit['mirrorCali'] == 3 and app_dit['status']:
-                        logger.debug("MIRROR TILT DOWN")
-                        await self.Vehicle.Body.Mirrors.Left.Tilt.set(VSS_MIRROR_TILT_DOWN)
-                    elif app_dit['mirrorCali'] == 3 and not app_dit['status']:
-                        logger.debug("MIRROR STOP")
-                        await self.Vehicle.Body.Mirrors.Left.Tilt.set(VSS_MIRROR_MOVE_STOP)
-                    else:
-                        pass
-                except:
-                    logger.error("Parse mirror control BT cmd error.")
-                    pass
-
-                # Parse ARI-BAG  inflation bag1,  2, stop, deflation
-                try:
-                    if app_dit['aircell'] == 0:
-                        logger.debug("AIR CELL0 inflation.")
-                        await self.Vehicle.Cabin.Seat.Row1.Pos1.Backrest.Lumbar.Support.set(VSS_LUMBAR_AIRCELL0)
-                    elif app_dit['aircell'] == 1:
-                        logger.debug("AIR CELL1 inflation.")
-                        await self.Vehicle.Cabin.Seat.Row1.Pos1.Backrest.Lumbar.Support.set(VSS_LUMBAR_AIRCELL1)
-                    elif app_dit['aircell'] == 2:
-                        logger.debug("STOP ALL AIR CELL INFLATION")
-                        await self.Vehicle.Cabin.Seat.Row1.Pos1.Backrest.Lumbar.Support.set(VSS_LUMBAR_AIRCELL_STOP)
-                    elif app_dit['aircell'] == 3:
-                        logger.debug("DEFLATION ALL")
-                        await self.Vehicle.Cabin.Seat.Row1.Pos1.Backrest.Lumbar.Support.set(VSS_LUMBAR_AIRCELL_DEFLATION)
-                except:
-                    logger.error("### Parse ARI CELL ctrl cmd error.")
-                    pass
-
-                # Parse HVAC Fan Speed control
-                try:
-                    if int(app_dit['fan']) >= 0:
-                        logger.debug("Send fan speed")
-                        await self.Vehicle.Cabin.HVAC.Station.Row1.Left.FanSpeed.set(int(app_dit['fan']))
-                    else:
-                        await self.Vehicle.Cabin.HVAC.Station.Row1.Left.FanSpeed.set(0)
-                except:
-                    logger.error("Parse HVAC FAN speed error.")
-                    pass
-                    
-                await self.publish_mqtt_event("sampleapp/bt_cmd/reponse", json.dumps({"bt_cmd": str(app_dit)}),)
-            await asyncio.sleep(0.1)
+        while True:
+            msg = await self._msg_q.get()
+            try:
+                await self.handle_bt_msg(msg)
+            finally:
+                self._msg_q.task_done()
+
+    async def handle_bt_msg(self, msg: bytes):
+        # Parse BT control command from MobilePhone APP.
+        try:
+            app_dit = _loads(msg)
+        except orjson.JSONDecodeError as e:
+            logger.error("Parser BT cmd JSON failed: %s", e)
+            return
+        if not isinstance(app_dit, dict):
+            logger.error("Parser BT cmd JSON failed: not an object.")
+            return
+        cmd = BTCmd.from_dict(app_dit)
+
+        pending = []
+        ###################################################################
+        # Free control seat position.
+        seat_pos = None
+        if cmd.seatPos is not None and 0 < cmd.seatPos <= 100:
+            logger.debug("Send seat position")
+            seat_pos = cmd.seatPos
+
+        # Parse BT Seat ECU control command from MobilePhone APP
+        seat_move = None
+        seat = _SEAT_DISPATCH.get((cmd.seatCali, cmd.status))
+        if seat is not None:
+            seat_move, desc = seat
+            logger.debug(desc)
+
+        # Both write the seat position signal, so they are sent in order.
+        if seat_pos is not None or seat_move is not None:
+            pending.append(self.move_seat_to(seat_pos, seat_move))
+
+        # Parse BT Mirror ECU control command from MobilePhone APP
+        mirror = _MIRROR_DISPATCH.get((cmd.mirrorCali, cmd.status))
+        if mirror is not None:
+            axis, value, desc = mirror
+            logger.debug(desc)
+            if axis == "pan":
+                set_mirror = self._set_mirror_pan
+            else:
+                set_mirror = self._set_mirror_tilt
+            # A BT command takes over from a pending voice command stop.
+            self._cancel_stop(set_mirror)
+            pending.append(set_mirror(value))
+
+        # Parse ARI-BAG  inflation bag1,  2, stop, deflation
+        aircell = _AIRCELL_DISPATCH.get(cmd.aircell)
+        if aircell is not None:
+            value, desc = aircell
+            logger.debug(desc)
+            self._cancel_stop(self._set_lumbar)
+            pending.append(self._set_lumbar(value))
+
+        # Parse HVAC Fan Speed control
+        if cmd.fan is not None:
+            logger.debug("Send fan speed")
+            pending.append(self._set_fan(max(cmd.fan, 0)))
+
+        self.queue_mqtt_event(
+            "sampleapp/bt_cmd/reponse", _dumps({"bt_cmd": str(app_dit)})
+        )
+
+        # Issue the sets of the independent actuators concurrently.
+        for result in await asyncio.gather(*pending, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error("Handle BT cmd failed: %s", result)
 
     async def on_timer(self):
         logging.debug("TASK LOOP ...")
         while 1:
             logging.debug("task loopping ...")
-            await self.publish_mqtt_event("sampleapp/tasks", json.dumps({"################## >>>> period tasks ###": self._idx}),)
+            self.queue_mqtt_event("sampleapp/tasks", _dumps({"################## >>>> period tasks ###": self._idx}),)
             self._idx = self._idx + 1
             await asyncio.sleep(2.0)
         pass
         
     def on_recv_bt_data(self):
-        global gSer, msgQ
-        msg = gSer.read()
-        recv_bt_dat = b""
-        while msg != b'\n':
-            recv_bt_dat += msg
-            msg = gSer.read()
-        logging.debug(b"##### BT CMD:" + recv_bt_dat)
-        ###################################################################
-        msgQ.put(recv_bt_dat)
-        
+        try:
+            frames = self._bt_frames.read(self._fd)
+        except BlockingIOError:
+            return
+        except (EOFError, OSError) as e:
+            self._stop_bt_reader(str(e))
+            return
+        for recv_bt_dat in frames:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("##### BT CMD: %s", recv_bt_dat)
+            ###################################################################
+            self._msg_q.put_nowait(recv_bt_dat)
+
+    def _stop_bt_reader(self, reason: str):
+        # The BT link is gone (e.g. adapter unplugged), stop watching the fd so
+        # the loop does not spin on a permanently readable descriptor.
+        logger.error("BT module disconnected (%s), stop reading.", reason)
+        asyncio.get_running_loop().remove_reader(self._fd)
+
     async def on_speed_change(self, data: DataPointReply):
         """The on_speed_change callback, this will be executed when receiving a new
         vehicle signal updates."""
@@ -273,10 +441,31 @@ async def on_speed_change(self, data: DataPointReply):
         # Do anything with the received value.
         # Example:
         # - Publishes current speed to MQTT Topic (i.e. DATABROKER_SUBSCRIPTION_TOPIC).
-
-        await self.publish_mqtt_event(
+        # Fast updates are coalesced, the latest value is sent once the interval
+        # since the last publish has passed.
+        self._pending_speed = vehicle_speed
+        self._speed_dirty = True
+        loop = asyncio.get_running_loop()
+        elapsed = loop.time() - self._last_speed_pub
+        if elapsed >= SPEED_PUBLISH_INTERVAL:
+            self.publish_pending_speed()
+        elif self._speed_timer is None:
+            self._speed_timer = loop.call_later(
+                SPEED_PUBLISH_INTERVAL - elapsed, self.publish_pending_speed
+            )
+
+    def publish_pending_speed(self):
+        if self._speed_timer is not None:
+            self._speed_timer.cancel()
+            self._speed_timer = None
+        if not self._speed_dirty:
+            return
+        vehicle_speed = self._pending_speed
+        self._speed_dirty = False
+        self._last_speed_pub = asyncio.get_running_loop().time()
+        self.queue_mqtt_event(
             DATABROKER_SUBSCRIPTION_TOPIC,
-            json.dumps({"speed": vehicle_speed}),
+            _dumps({"speed": vehicle_speed}),
         )
 
     @subscribe_topic(GET_SPEED_REQUEST_TOPIC)
@@ -299,29 +488,15 @@ async def on_get_speed_request_received(self, data: str) -> None:
         # Do anything with the speed value.
         # Example:
         # - Publishe the vehicle speed to MQTT topic (i.e. GET_SPEED_RESPONSE_TOPIC).
-        await self.publish_mqtt_event(
+        self.queue_mqtt_event(
             GET_SPEED_RESPONSE_TOPIC,
-            json.dumps(
-                {
-                    "result": {
-                        "status": 0,
-                        "message": f"""Current Speed = {vehicle_speed}""",
-                    },
-                }
-            ),
+            _SPEED_RESULT_TPL(vehicle_speed),
         )
 
-    async def send_mqtt_response(self, msg: str):
-        await self.publish_mqtt_event(
+    def send_mqtt_response(self, msg: str):
+        self.queue_mqtt_event(
             VOICE_CONTROL_RESPONSE_TOPICE,
-            json.dumps(
-                {
-                    "result": {
-                        "status": 1,
-                        "message": msg,
-                    },
-                }
-            ),
+            _VOICE_RESULT_TPL(_dumps(msg)),
         )
 
     @subscribe_topic(VOICE_CONTROL_REQUEST_TOPIC)
@@ -332,88 +507,117 @@ async def on_voice_control_request_received(self, data: str):
             data,
         )
 
-        voice_data = json.loads(data)
-        voice_cmd = voice_data.get('voice_cmd')
-        global seat_position_current
+        voice_data = _loads(data)
+        handler = _VOICE_HANDLERS.get(voice_data.get("voice_cmd"))
+        if handler is not None:
+            await handler(self)
 
-        if SDVOS_SEAT_MOVE_FORWARD == voice_cmd:
-            positon = seat_position_current + VSS_SEAT_POSITION_MOVE_STEP
-            if seat_position_current >= VSS_SEAT_POSITION_MAX:
-                await self.send_mqtt_response("The Seat Position will"
-                                              "be bigger than max value(60).")
-            else:
-                await self.Vehicle.Cabin.Seat.Row1.Pos1.Position.set(positon)
-                seat_position_current = positon
-                logger.debug(f"The current seat position is {seat_position_current}")
-
-        if SDVOS_SEAT_MOVE_BACKWARD == voice_cmd:
-            positon = seat_position_current - VSS_SEAT_POSITION_MOVE_STEP
-            if seat_position_current <= VSS_SEAT_POSITION_MIN:
-                await self.send_mqtt_response("The Seat Position will"
-                                              "be litter than min value(40).")
-            else:
-                await self.Vehicle.Cabin.Seat.Row1.Pos1.Position.set(positon)
-                seat_position_current = positon
-                logger.debug(f"The current seat position is {seat_position_current}")
-
-        if SDVOS_FAN_START == voice_cmd:
-            await self.Vehicle.Cabin.HVAC.Station.Row1.Left.FanSpeed.set(VSS_FAN_START)
-            logger.debug(f"Fan is enabled as {VSS_FAN_START}")
-
-        if SDVOS_FAN_STOP == voice_cmd:
-            await self.Vehicle.Cabin.HVAC.Station.Row1.Left.FanSpeed.set(VSS_FAN_STOP)
-            logger.debug("Fan is disabled.")
-
-        if SDVOS_MIRRORREAR_PAN_LEFT == voice_cmd:
-            logger.debug("Mirror pan left.")
-            await self.Vehicle.Body.Mirrors.Left.Pan.set(VSS_MIRROR_PAN_LEFT)
-            await asyncio.sleep(2)
-            await self.Vehicle.Body.Mirrors.Left.Pan.set(VSS_MIRROR_MOVE_STOP)
-
-        if SDVOS_MIRRORREAR_PAN_RIGHT == voice_cmd:
-            logger.debug("Mirror pan right.")
-            await self.Vehicle.Body.Mirrors.Left.Pan.set(VSS_MIRROR_PAN_RIGHT)
-            await asyncio.sleep(2)
-            await self.Vehicle.Body.Mirrors.Left.Pan.set(VSS_MIRROR_MOVE_STOP)
-
-        if SDVOS_MIRRORREAR_TITL_UP == voice_cmd:
-            logger.debug("Mirror tilt up.")
-            await self.Vehicle.Body.Mirrors.Left.Tilt.set(VSS_MIRROR_TILT_UP)
-            await asyncio.sleep(2)
-            await self.Vehicle.Body.Mirrors.Left.Tilt.set(VSS_MIRROR_MOVE_STOP)
-
-        if SDVOS_MIRRORREAR_TITL_DOWN == voice_cmd:
-            logger.debug("Mirror tilt down.")
-            await self.Vehicle.Body.Mirrors.Left.Tilt.set(VSS_MIRROR_TILT_DOWN)
-            await asyncio.sleep(2)
-            await self.Vehicle.Body.Mirrors.Left.Tilt.set(VSS_MIRROR_MOVE_STOP)
-
-        if SDVOS_LUMBAR_SUPPORT_01_INFLATION == voice_cmd:
-            logger.debug("Air cell start.")
-            await self.Vehicle.Cabin.Seat.Row1.Pos1.Backrest.Lumbar.Support.set(VSS_LUMBAR_AIRCELL0)
-            await asyncio.sleep(2)
-            await self.Vehicle.Cabin.Seat.Row1.Pos1.Backrest.Lumbar.Support.set(VSS_LUMBAR_AIRCELL_STOP)
-
-        if SDVOS_LUMBAR_SUPPORT_02_INFLATION == voice_cmd:
-            await self.Vehicle.Cabin.Seat.Row1.Pos1.Backrest.Lumbar.Support.set(VSS_LUMBAR_AIRCELL1)
-            await asyncio.sleep(2)
-            await self.Vehicle.Cabin.Seat.Row1.Pos1.Backrest.Lumbar.Support.set(VSS_LUMBAR_AIRCELL_STOP)
-
-        if SDVOS_LUMBAR_SUPPORT_DEFLATION == voice_cmd:
-            logger.debug("Air cell deflation.")
-            await self.Vehicle.Cabin.Seat.Row1.Pos1.Backrest.Lumbar.Support.set(VSS_LUMBAR_AIRCELL_DEFLATION)
-            await asyncio.sleep(2)
-            await self.Vehicle.Cabin.Seat.Row1.Pos1.Backrest.Lumbar.Support.set(VSS_LUMBAR_AIRCELL_STOP)
+
+async def _handle_seat_forward(app: SampleApp):
+    async with app._seat_lock:
+        if app._seat_pos >= VSS_SEAT_POSITION_MAX:
+            app.send_mqtt_response("The Seat Position will"
+                                   "be bigger than max value(60).")
+            return
+        positon = app._seat_pos + VSS_SEAT_POSITION_MOVE_STEP
+        await app._set_seat_pos(positon)
+        app._seat_pos = positon
+    logger.debug("The current seat position is %s", positon)
+
+
+async def _handle_seat_backward(app: SampleApp):
+    async with app._seat_lock:
+        if app._seat_pos <= VSS_SEAT_POSITION_MIN:
+            app.send_mqtt_response("The Seat Position will"
+                                   "be litter than min value(40).")
+            return
+        positon = app._seat_pos - VSS_SEAT_POSITION_MOVE_STEP
+        await app._set_seat_pos(positon)
+        app._seat_pos = positon
+    logger.debug("The current seat position is %s", positon)
+
+
+async def _handle_fan_start(app: SampleApp):
+    await app._set_fan(VSS_FAN_START)
+    logger.debug("Fan is enabled as %s", VSS_FAN_START)
+
+
+async def _handle_fan_stop(app: SampleApp):
+    await app._set_fan(VSS_FAN_STOP)
+    logger.debug("Fan is disabled.")
+
+
+async def _handle_mirror_pan_left(app: SampleApp):
+    logger.debug("Mirror pan left.")
+    await app._set_mirror_pan(VSS_MIRROR_PAN_LEFT)
+    app._schedule_stop(app._set_mirror_pan, VSS_MIRROR_MOVE_STOP)
+
+
+async def _handle_mirror_pan_right(app: SampleApp):
+    logger.debug("Mirror pan right.")
+    await app._set_mirror_pan(VSS_MIRROR_PAN_RIGHT)
+    app._schedule_stop(app._set_mirror_pan, VSS_MIRROR_MOVE_STOP)
+
+
+async def _handle_mirror_tilt_up(app: SampleApp):
+    logger.debug("Mirror tilt up.")
+    await app._set_mirror_tilt(VSS_MIRROR_TILT_UP)
+    app._schedule_stop(app._set_mirror_tilt, VSS_MIRROR_MOVE_STOP)
+
+
+async def _handle_mirror_tilt_down(app: SampleApp):
+    logger.debug("Mirror tilt down.")
+    await app._set_mirror_tilt(VSS_MIRROR_TILT_DOWN)
+    app._schedule_stop(app._set_mirror_tilt, VSS_MIRROR_MOVE_STOP)
+
+
+async def _handle_lumbar_inflation(app: SampleApp):
+    logger.debug("Air cell start.")
+    # Inflate air cell 0, then air cell 1 once cell 0 has been stopped.
+    await app._set_lumbar(VSS_LUMBAR_AIRCELL0)
+    app._schedule_stop(
+        app._set_lumbar, VSS_LUMBAR_AIRCELL_STOP, then=VSS_LUMBAR_AIRCELL1
+    )
+
+
+async def _handle_lumbar_deflation(app: SampleApp):
+    logger.debug("Air cell deflation.")
+    await app._set_lumbar(VSS_LUMBAR_AIRCELL_DEFLATION)
+    app._schedule_stop(app._set_lumbar, VSS_LUMBAR_AIRCELL_STOP)
+
+
+# Voice command -> handler, looked up once per received voice command.
+_VOICE_HANDLERS: Dict[int, Callable[[SampleApp], Awaitable[None]]] = {
+    SDVOS_SEAT_MOVE_FORWARD: _handle_seat_forward,
+    SDVOS_SEAT_MOVE_BACKWARD: _handle_seat_backward,
+    SDVOS_FAN_START: _handle_fan_start,
+    SDVOS_FAN_STOP: _handle_fan_stop,
+    SDVOS_MIRRORREAR_PAN_LEFT: _handle_mirror_pan_left,
+    SDVOS_MIRRORREAR_PAN_RIGHT: _handle_mirror_pan_right,
+    SDVOS_MIRRORREAR_TITL_UP: _handle_mirror_tilt_up,
+    SDVOS_MIRRORREAR_TITL_DOWN: _handle_mirror_tilt_down,
+    SDVOS_LUMBAR_SUPPORT_01_INFLATION: _handle_lumbar_inflation,
+    SDVOS_LUMBAR_SUPPORT_DEFLATION: _handle_lumbar_deflation,
+}
 
 
 async def main():
     """Main function"""
     logger.info("Starting SampleApp...")
+    # Stop the app on SIGTERM by cancelling this task.
+    main_task = asyncio.current_task()
+    assert main_task is not None
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, main_task.cancel)
     # Constructing SampleApp and running it.
     vehicle_app = SampleApp(vehicle)
-    await vehicle_app.run()
+    try:
+        await vehicle_app.run()
+    except asyncio.CancelledError:
+        logger.info("SampleApp stopped.")
+
 
-LOOP = asyncio.get_event_loop()
-LOOP.add_signal_handler(signal.SIGTERM, LOOP.stop)
-LOOP.run_until_complete(main())
-LOOP.close()
+if __name__ == "__main__":
+    _configure_logging()
+    # libuv based event loop for the MQTT, DataBroker and BT serial I/O.
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    asyncio.run(main())
@@ -0,0 +1,38 @@
+# Copyright (c) 2022 Robert Bosch GmbH and Microsoft Corporation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+from unittest import mock
+
+import pytest
+
+# Make the app modules (app/src) importable from the unit tests.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+
+@pytest.fixture
+def app():
+    """SampleApp on a mocked vehicle, the DataBroker setters are AsyncMocks."""
+    from main import SampleApp
+    from sdv.vehicle_app import VehicleApp
+
+    vehicle = mock.MagicMock()
+    vehicle.Cabin.Seat.Row1.Pos1.Position.set = mock.AsyncMock()
+    vehicle.Body.Mirrors.Left.Pan.set = mock.AsyncMock()
+    vehicle.Body.Mirrors.Left.Tilt.set = mock.AsyncMock()
+    vehicle.Cabin.Seat.Row1.Pos1.Backrest.Lumbar.Support.set = mock.AsyncMock()
+    vehicle.Cabin.HVAC.Station.Row1.Left.FanSpeed.set = mock.AsyncMock()
+    with mock.patch.object(VehicleApp, "__init__", return_value=None):
+        return SampleApp(vehicle)
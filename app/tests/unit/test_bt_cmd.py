@@ -0,0 +1,110 @@
+# Copyright (c) 2022 Robert Bosch GmbH and Microsoft Corporation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# skip B101
+
+import asyncio
+import contextlib
+from unittest import mock
+
+import pytest
+from main import (  # type: ignore
+    VSS_MIRROR_TILT_UP,
+    VSS_SEAT_BACKWARD,
+    VSS_SEAT_FORWARD,
+    VSS_SEAT_MOVE_STOP,
+)
+
+
+async def feed_frames(app, *frames):
+    """Pass the frames through on_got_msg and wait until all are handled."""
+    for frame in frames:
+        app._msg_q.put_nowait(frame)
+    task = asyncio.create_task(app.on_got_msg())
+    await app._msg_q.join()
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+
+def published(app):
+    payloads = []
+    while not app._pub_q.empty():
+        payloads.append(app._pub_q.get_nowait())
+    return payloads
+
+
+@pytest.mark.asyncio
+async def test_bad_field_keeps_other_fields(app):
+    await feed_frames(app, b'{"fan":"high","mirrorCali":1,"status":1}')
+    app._set_fan.assert_not_awaited()
+    app._set_mirror_tilt.assert_awaited_once_with(VSS_MIRROR_TILT_UP)
+
+
+@pytest.mark.asyncio
+async def test_float_numbers_and_truthy_status(app):
+    await feed_frames(app, b'{"fan":30.7,"mirrorCali":1.0,"status":2}')
+    app._set_fan.assert_awaited_once_with(30)
+    app._set_mirror_tilt.assert_awaited_once_with(VSS_MIRROR_TILT_UP)
+
+
+@pytest.mark.asyncio
+async def test_missing_status_sends_nothing(app):
+    await feed_frames(app, b'{"mirrorCali":0}')
+    app._set_mirror_pan.assert_not_awaited()
+    app._set_mirror_tilt.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_invalid_frames_are_skipped(app):
+    await feed_frames(app, b"{", b"[1]", b'{"fan":10}')
+    app._set_fan.assert_awaited_once_with(10)
+    assert published(app) == [
+        ("sampleapp/bt_cmd/reponse", '{"bt_cmd":"{\'fan\': 10}"}')
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_set_is_logged(app):
+    app._set_fan.side_effect = RuntimeError("broker down")
+    with mock.patch("main.logger") as logger:
+        await feed_frames(app, b'{"fan":10}')
+    logger.error.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_seat_move_and_stop(app):
+    await feed_frames(
+        app, b'{"seatCali":0,"status":true}', b'{"seatCali":0,"status":0}'
+    )
+    assert app._set_seat_pos.await_args_list == [
+        mock.call(VSS_SEAT_FORWARD),
+        mock.call(VSS_SEAT_MOVE_STOP),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_seat_position_is_sent_before_seat_move(app):
+    await feed_frames(app, b'{"seatPos":55,"seatCali":1,"status":1}')
+    assert app._set_seat_pos.await_args_list == [
+        mock.call(55),
+        mock.call(VSS_SEAT_BACKWARD),
+    ]
+    assert app._seat_pos == 55
+
+
+@pytest.mark.asyncio
+async def test_seat_position_out_of_range_is_ignored(app):
+    await feed_frames(app, b'{"seatPos":0}', b'{"seatPos":101}')
+    app._set_seat_pos.assert_not_awaited()
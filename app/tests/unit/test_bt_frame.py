@@ -0,0 +1,81 @@
+# Copyright (c) 2022 Robert Bosch GmbH and Microsoft Corporation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# skip B101
+
+import os
+
+import pytest
+from bt_frame import BTFrameBuffer
+
+
+@pytest.fixture
+def pipe():
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    yield read_fd, write_fd
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+def test_split_frame_is_joined(pipe):
+    read_fd, write_fd = pipe
+    frames = BTFrameBuffer(16)
+
+    os.write(write_fd, b'{"fan"')
+    assert frames.read(read_fd) == []
+    os.write(write_fd, b":1}\n")
+    assert frames.read(read_fd) == [b'{"fan":1}']
+
+
+def test_multiple_frames_in_one_read(pipe):
+    read_fd, write_fd = pipe
+    frames = BTFrameBuffer(32)
+
+    os.write(write_fd, b'{"a":1}\n{"b":2}\n{"c"')
+    assert frames.read(read_fd) == [b'{"a":1}', b'{"b":2}']
+    os.write(write_fd, b":3}\n")
+    assert frames.read(read_fd) == [b'{"c":3}']
+
+
+def test_exact_fit_frame(pipe):
+    read_fd, write_fd = pipe
+    frames = BTFrameBuffer(8)
+
+    os.write(write_fd, b"1234567\n")
+    assert frames.read(read_fd) == [b"1234567"]
+
+
+def test_oversized_frame_is_dropped(pipe):
+    read_fd, write_fd = pipe
+    frames = BTFrameBuffer(8)
+
+    os.write(write_fd, b"x" * 20 + b"\n" + b'{"a":1}\n')
+    received = []
+    with pytest.raises(BlockingIOError):
+        while True:
+            received += frames.read(read_fd)
+    assert received == [b'{"a":1}']
+
+
+def test_end_of_file():
+    read_fd, write_fd = os.pipe()
+    frames = BTFrameBuffer(8)
+
+    os.write(write_fd, b"ab\n")
+    os.close(write_fd)
+    assert frames.read(read_fd) == [b"ab"]
+    with pytest.raises(EOFError):
+        frames.read(read_fd)
+    os.close(read_fd)
@@ -0,0 +1,63 @@
+# Copyright (c) 2022 Robert Bosch GmbH and Microsoft Corporation
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# skip B101
+
+import asyncio
+from unittest import mock
+
+import pytest
+from main import DATABROKER_SUBSCRIPTION_TOPIC, SPEED_PUBLISH_INTERVAL  # type: ignore
+
+
+def speed_reply(speed):
+    data = mock.Mock()
+    data.get.return_value.value = speed
+    return data
+
+
+def published(app):
+    payloads = []
+    while not app._pub_q.empty():
+        topic, payload = app._pub_q.get_nowait()
+        assert topic == DATABROKER_SUBSCRIPTION_TOPIC
+        payloads.append(payload)
+    return payloads
+
+
+@pytest.mark.asyncio
+async def test_speed_updates_are_coalesced(app):
+    await app.on_speed_change(speed_reply(1.0))
+    assert published(app) == ['{"speed":1.0}']
+
+    await app.on_speed_change(speed_reply(2.0))
+    await app.on_speed_change(speed_reply(3.0))
+    assert published(app) == []
+
+    await asyncio.sleep(SPEED_PUBLISH_INTERVAL * 1.5)
+    assert published(app) == ['{"speed":3.0}']
+
+
+@pytest.mark.asyncio
+async def test_latest_none_speed_is_published(app):
+    await app.on_speed_change(speed_reply(1.0))
+    await app.on_speed_change(speed_reply(2.0))
+    await app.on_speed_change(speed_reply(None))
+    assert published(app) == ['{"speed":1.0}']
+
+    await asyncio.sleep(SPEED_PUBLISH_INTERVAL * 1.5)
+    assert published(app) == ['{"speed":null}']
+
+    await asyncio.sleep(SPEED_PUBLISH_INTERVAL * 1.5)
+    assert published(app) == []